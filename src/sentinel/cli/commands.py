@@ -63,25 +63,32 @@ from sentinel.core.types import (
     ScoredCollision,
     strip_domain_prefix,
 )
-from sentinel.viz import render_ascii, render_html
+from sentinel.viz import render_ascii, render_html_to_file
 
 logger = logging.getLogger(__name__)
 console = Console()
 error_console = Console(stderr=True)
 
 
-def _write_html_file(path: Path, content: str) -> bool:
-    """Write HTML content to file with error handling.
+def _write_html_file(
+    path: Path,
+    graph: Graph,
+    collision_paths: list[tuple[str, ...]] | None = None,
+) -> bool:
+    """Render a graph to an HTML file with error handling.
+
+    The document is streamed straight to disk rather than built in memory.
 
     Args:
         path: Path to write to.
-        content: HTML content to write.
+        graph: Graph to visualize.
+        collision_paths: Optional collision paths to highlight.
 
     Returns:
         True if successful, False otherwise.
     """
     try:
-        path.write_text(content, encoding="utf-8")
+        render_html_to_file(graph, path, collision_paths=collision_paths)
         return True
     except PermissionError:
         error_console.print(f"[red]Error:[/red] Permission denied writing to {path}")
@@ -466,9 +473,8 @@ def paste(ctx: click.Context, output_format: str, output: str | None) -> None:
         if output_format == "html":
             # Generate HTML visualization
             vlog.start_operation("Render HTML")
-            html_content = render_html(graph)
             output_path = Path(output) if output else Path(DEFAULT_PASTE_HTML_FILENAME)
-            if _write_html_file(output_path, html_content):
+            if _write_html_file(output_path, graph):
                 vlog.end_operation("Render HTML", str(output_path))
                 console.print(f"[green]✓[/green] Graph saved to {output_path}")
             else:
@@ -794,9 +800,8 @@ def check(
         # Handle output format
         if output_format == "html":
             # Generate HTML with graph visualization and collision highlighting
-            html_content = render_html(graph, collision_paths=collision_paths)
             output_path = Path(output) if output else Path(DEFAULT_CHECK_HTML_FILENAME)
-            if _write_html_file(output_path, html_content):
+            if _write_html_file(output_path, graph, collision_paths=collision_paths):
                 console.print(f"[green]✓[/green] Report saved to {output_path}")
             else:
                 raise SystemExit(EXIT_INTERNAL_ERROR)
@@ -1628,9 +1633,8 @@ def graph_cmd(
         if node is None:
             # Handle output format
             if output_format == "html":
-                html_content = render_html(graph)
                 output_path = Path(output) if output else Path(DEFAULT_GRAPH_HTML_FILENAME)
-                if _write_html_file(output_path, html_content):
+                if _write_html_file(output_path, graph):
                     console.print(f"[green]✓[/green] Graph saved to {output_path}")
                 else:
                     raise SystemExit(EXIT_INTERNAL_ERROR)
@@ -1680,9 +1684,8 @@ def graph_cmd(
 
         # Handle output format
         if output_format == "html":
-            html_content = render_html(neighborhood)
             output_path = Path(output) if output else Path(DEFAULT_GRAPH_HTML_FILENAME)
-            if _write_html_file(output_path, html_content):
+            if _write_html_file(output_path, neighborhood):
                 console.print(f"[green]✓[/green] Graph saved to {output_path}")
             else:
                 raise SystemExit(EXIT_INTERNAL_ERROR)
@@ -8,7 +8,7 @@ the XDG_CONFIG_HOME environment variable when set.
 import os
 import re
 import tomllib
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, fields, replace
 from pathlib import Path
 from typing import Literal
 
@@ -164,6 +164,9 @@ class SentinelConfig:
 
 DEFAULT_CONFIG = SentinelConfig()
 
+# Field names accepted from config.toml; other keys are ignored
+_CONFIG_FIELDS: frozenset[str] = frozenset(f.name for f in fields(SentinelConfig))
+
 
 def _validate_config_values(data: dict[str, object]) -> None:
     """Validate config values against allowed Literal types.
@@ -218,6 +221,9 @@ default_format = "text"
 telemetry_enabled = false
 """
 
+# Encoded once at import; write_default_config() writes these bytes directly
+_DEFAULT_CONFIG_TOML_BYTES = DEFAULT_CONFIG_TOML.encode("utf-8")
+
 
 def load_config(config_path: Path | None = None) -> SentinelConfig:
     """Load configuration from TOML file.
@@ -247,10 +253,10 @@ def load_config(config_path: Path | None = None) -> SentinelConfig:
     _validate_config_values(data)
 
     # Merge with defaults - only use keys that are valid SentinelConfig fields
-    valid_fields = {f.name for f in fields(SentinelConfig)}
-    filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+    filtered_data = {k: v for k, v in data.items() if k in _CONFIG_FIELDS}
 
-    return SentinelConfig(**{**DEFAULT_CONFIG.__dict__, **filtered_data})
+    # A file with no recognised settings is just the defaults; share the singleton
+    return replace(DEFAULT_CONFIG, **filtered_data) if filtered_data else DEFAULT_CONFIG
 
 
 def get_confidence_threshold(energy_threshold: str) -> float:
@@ -269,6 +275,29 @@ def get_confidence_threshold(energy_threshold: str) -> float:
     return ENERGY_THRESHOLD_MAP.get(energy_threshold, ENERGY_THRESHOLD_MEDIUM)
 
 
+def _write_private_file(path: Path, data: bytes) -> None:
+    """Write bytes to a file that is owner read/write only from creation.
+
+    The file is opened with mode 600, so it is never briefly readable by
+    group/other as it would be if created with default permissions and
+    chmod-ed afterwards. The fchmod on the open descriptor pins the mode
+    regardless of umask or a stale file left by an interrupted write.
+
+    Args:
+        path: File to create or truncate.
+        data: Full file contents.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.fchmod(fd, 0o600)
+        # Unbuffered: the payload is small, so write it straight to the fd
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def write_default_config(config_path: Path | None = None) -> None:
     """Write default configuration file with documented settings.
 
@@ -296,11 +325,7 @@ def write_default_config(config_path: Path | None = None) -> None:
 
     temp_path = config_path.with_suffix(".tmp")
     try:
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(DEFAULT_CONFIG_TOML)
-
-        # Set permissions before move (0o600 = owner read/write only)
-        temp_path.chmod(0o600)
+        _write_private_file(temp_path, _DEFAULT_CONFIG_TOML_BYTES)
         temp_path.replace(config_path)
     finally:
         # Clean up temp file if it still exists
@@ -541,8 +566,7 @@ def update_config(key: str, value: str, config_path: Path | None = None) -> None
     # Write atomically
     temp_path = config_path.with_suffix(".tmp")
     try:
-        temp_path.write_text(new_content)
-        temp_path.chmod(0o600)
+        _write_private_file(temp_path, new_content.encode("utf-8"))
         temp_path.replace(config_path)
     finally:
         try:
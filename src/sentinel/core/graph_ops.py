@@ -64,7 +64,7 @@ def extract_neighborhood(
                 queue.append((neighbor_id, current_depth + 1))
 
     # Extract nodes in neighborhood
-    node_map = {n.id: n for n in graph.nodes}
+    node_map = graph.by_id
     neighborhood_nodes = tuple(node_map[nid] for nid in visited if nid in node_map)
 
     # Extract edges between neighborhood nodes
@@ -379,7 +379,7 @@ def score_collision(path: CollisionPath, graph: Graph) -> ScoredCollision:
         node_ids.add(edge.target_id)
 
     # Build node lookup
-    nodes = {n.id: n for n in graph.nodes}
+    nodes = graph.by_id
 
     # Count AI-inferred vs user-stated
     ai_inferred_count = 0
@@ -477,7 +477,7 @@ def score_collision_with_domains(path: CollisionPath, graph: Graph) -> ScoredCol
     base_collision = score_collision(path, graph)
 
     # Build node lookup
-    nodes = {n.id: n for n in graph.nodes}
+    nodes = graph.by_id
 
     # Find the source (DRAINS source) and target (REQUIRES source) nodes
     # The start_node is the source of DRAINS edge
@@ -557,7 +557,7 @@ def is_valid_collision(path: CollisionPath, graph: Graph) -> bool:
         return False
 
     # Build node lookup for type checking
-    nodes = {n.id: n for n in graph.nodes}
+    nodes = graph.by_id
 
     # Rule 4: Start node must be Person, Activity, or TimeSlot
     # (TimeSlot allowed because LLM often types scheduled events as TimeSlot)
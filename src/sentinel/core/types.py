@@ -7,6 +7,7 @@ All types are immutable dataclasses for thread safety and predictability.
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import cached_property
 from typing import Any, Literal
 
 # Source types for tracking provenance
@@ -26,7 +27,7 @@ class Domain(Enum):
     PERSONAL = auto()  # Default/ambiguous
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node:
     """A node in the knowledge graph.
 
@@ -45,7 +46,7 @@ class Node:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edge:
     """An edge connecting two nodes in the knowledge graph.
 
@@ -76,6 +77,15 @@ class Graph:
     nodes: tuple[Node, ...] = field(default_factory=tuple)
     edges: tuple[Edge, ...] = field(default_factory=tuple)
 
+    @cached_property
+    def by_id(self) -> dict[str, Node]:
+        """Node lookup by ID, built once per graph instance.
+
+        Safe to cache because the graph is immutable. Callers must treat
+        the returned dict as read-only.
+        """
+        return {n.id: n for n in self.nodes}
+
 
 @dataclass(frozen=True)
 class ScoredCollision:
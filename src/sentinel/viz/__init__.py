@@ -4,6 +4,6 @@ Provides ASCII and HTML graph rendering.
 """
 
 from sentinel.viz.ascii import graph_to_networkx, render_ascii
-from sentinel.viz.html import render_html
+from sentinel.viz.html import render_html, render_html_to_file
 
-__all__ = ["render_ascii", "graph_to_networkx", "render_html"]
+__all__ = ["render_ascii", "graph_to_networkx", "render_html", "render_html_to_file"]
@@ -4,9 +4,15 @@ Generates self-contained HTML files with SVG-based graph visualization.
 Uses circle layout for node positioning and inline CSS for styling.
 """
 
+import functools
+import io
 import logging
 import math
+import os
+import stat
+import tempfile
 from datetime import UTC, datetime
+from typing import TextIO
 
 from sentinel.core.types import Edge, Graph, Node
 
@@ -28,6 +34,35 @@ COLOR_EDGE_LABEL = "#666666"  # Medium gray
 NODE_RADIUS = 8
 LABEL_OFFSET = 12
 
+# Vertical distance from node center to its label baseline
+_LABEL_DY = LABEL_OFFSET + NODE_RADIUS
+
+# Node (CSS class, circle style attributes) keyed by (is_user_stated, is_collision).
+# Attributes are pre-rendered so constants aren't re-formatted for every node.
+_NODE_STYLE: dict[tuple[bool, bool], tuple[str, str]] = {
+    (True, False): ("node user-stated", f'r="{NODE_RADIUS}" fill="{COLOR_USER_STATED}"'),
+    (True, True): ("node user-stated collision", f'r="{NODE_RADIUS}" fill="{COLOR_USER_STATED}"'),
+    (False, False): ("node ai-inferred", f'r="{NODE_RADIUS}" fill="{COLOR_AI_INFERRED}"'),
+    (False, True): ("node ai-inferred collision", f'r="{NODE_RADIUS}" fill="{COLOR_AI_INFERRED}"'),
+}
+
+# Edge (CSS class, line stroke attributes) keyed by is_collision
+_EDGE_STYLE: dict[bool, tuple[str, str]] = {
+    False: ("edge", f'stroke="{COLOR_EDGE}" stroke-width="1.5"'),
+    True: ("edge collision-highlight", f'stroke="{COLOR_COLLISION}" stroke-width="3"'),
+}
+
+# Character translation table for HTML escaping
+_HTML_ESCAPE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#39;",
+    }
+)
+
 
 def _calculate_node_positions(
     nodes: tuple[Node, ...],
@@ -68,22 +103,20 @@ def _calculate_node_positions(
     return positions
 
 
+@functools.lru_cache(maxsize=4096)
 def _escape_html(text: str) -> str:
     """Escape HTML special characters.
 
+    Cached because relationship labels (DRAINS, SCHEDULED_AT, ...) repeat
+    across many edges and renders.
+
     Args:
         text: Text to escape.
 
     Returns:
         HTML-safe text.
     """
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+    return text.translate(_HTML_ESCAPE)
 
 
 def _generate_node_svg(
@@ -103,24 +136,15 @@ def _generate_node_svg(
     Returns:
         SVG string containing circle and text elements.
     """
-    # Determine color based on source
-    if node.source == "user-stated":
-        fill_color = COLOR_USER_STATED
-        css_class = "node user-stated"
-    else:
-        fill_color = COLOR_AI_INFERRED
-        css_class = "node ai-inferred"
-
-    # Add collision styling if needed
-    if is_collision:
-        css_class += " collision"
+    # CSS class and circle attributes keyed by (source, collision)
+    css_class, circle_attrs = _NODE_STYLE[(node.source == "user-stated", is_collision)]
 
     # Escape label for HTML
     safe_label = _escape_html(node.label)
 
-    text_y = y + LABEL_OFFSET + NODE_RADIUS
+    text_y = y + _LABEL_DY
     return f"""    <g class="{css_class}">
-      <circle cx="{x:.1f}" cy="{y:.1f}" r="{NODE_RADIUS}" fill="{fill_color}" />
+      <circle cx="{x:.1f}" cy="{y:.1f}" {circle_attrs} />
       <text x="{x:.1f}" y="{text_y:.1f}" text-anchor="middle" class="node-label">{safe_label}</text>
     </g>"""
 
@@ -150,9 +174,7 @@ def _generate_edge_svg(
     mx, my = (x1 + x2) / 2, (y1 + y2) / 2
 
     # Determine styling
-    css_class = "edge collision-highlight" if is_collision else "edge"
-    stroke_color = COLOR_COLLISION if is_collision else COLOR_EDGE
-    stroke_width = 3 if is_collision else 1.5
+    css_class, stroke_attrs = _EDGE_STYLE[is_collision]
 
     # Escape relationship label
     safe_label = _escape_html(edge.relationship)
@@ -160,7 +182,7 @@ def _generate_edge_svg(
     label_y = my - 5
     line_elem = (
         f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" '
-        f'stroke="{stroke_color}" stroke-width="{stroke_width}" marker-end="url(#arrowhead)" />'
+        f'{stroke_attrs} marker-end="url(#arrowhead)" />'
     )
     text_elem = (
         f'<text x="{mx:.1f}" y="{label_y:.1f}" '
@@ -304,6 +326,27 @@ def _generate_svg_defs() -> str:
   </defs>"""
 
 
+# Buffer size for streaming HTML to disk
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Static document fragments, rendered once at import. The page title is the
+# only dynamic piece of the prologue, so it is split around the <title> text.
+_SVG_ATTRS = f'viewBox="0 0 {SVG_WIDTH} {SVG_HEIGHT}" width="{SVG_WIDTH}" height="{SVG_HEIGHT}"'
+_SVG_DEFS = _generate_svg_defs()
+_HTML_PROLOGUE_OPEN = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>"""
+_HTML_PROLOGUE_CLOSE = f"""</title>
+{_generate_css()}
+</head>
+<body>
+  <h1>Sentinel Energy Graph</h1>
+"""
+
+
 def _generate_collision_cards(collision_paths: list[tuple[str, ...]]) -> str:
     """Generate HTML for collision warning cards.
 
@@ -338,23 +381,43 @@ def _generate_collision_cards(collision_paths: list[tuple[str, ...]]) -> str:
   </section>"""
 
 
-def render_html(
+def _render_into(
+    out: TextIO,
     graph: Graph,
     collision_paths: list[tuple[str, ...]] | None = None,
     title: str | None = None,
-) -> str:
-    """Generate self-contained HTML with SVG graph visualization.
+) -> None:
+    """Write the self-contained HTML document to a text stream.
+
+    Node and edge fragments are written as they are generated, so no
+    full-document string is built.
 
     Args:
+        out: Text stream to write to.
         graph: Sentinel Graph to visualize.
         collision_paths: Optional list of collision path tuples for highlighting.
         title: Optional custom title for the HTML page.
-
-    Returns:
-        Complete HTML document as a string.
     """
     timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
     page_title = title or f"Sentinel Graph - {timestamp}"
+    write = out.write
+    write(_HTML_PROLOGUE_OPEN)
+    write(_escape_html(page_title))
+    write(_HTML_PROLOGUE_CLOSE)
+
+    # Handle empty graph
+    if not graph.nodes:
+        write(f"""  <div class="graph-container">
+    <div class="empty-state">
+      <p>No data available. Import your schedule to visualize your energy graph.</p>
+    </div>
+  </div>
+  <footer>
+    <p>Generated by Sentinel at {timestamp}</p>
+  </footer>
+</body>
+</html>""")
+        return
 
     # Build set of collision node labels and edge pairs for highlighting
     collision_labels: set[str] = set()
@@ -362,45 +425,27 @@ def render_html(
     if collision_paths:
         for path in collision_paths:
             # Extract entities (even indices: 0, 2, 4, ...)
-            entities = [path[i] for i in range(0, len(path), 2)]
-            # Add all entities to collision labels
-            for entity in entities:
-                collision_labels.add(entity)
+            entities = path[0::2]
+            collision_labels.update(entities)
             # Add edges between consecutive entities
-            for j in range(len(entities) - 1):
-                collision_edges.add((entities[j], entities[j + 1]))
+            collision_edges.update(zip(entities, entities[1:]))
 
     # Calculate positions
     positions = _calculate_node_positions(graph.nodes)
 
-    # Build node lookup for O(1) access (performance optimization)
-    nodes_by_id: dict[str, Node] = {n.id: n for n in graph.nodes}
+    # Node lookup for O(1) access (cached on the immutable graph)
+    nodes_by_id = graph.by_id
 
-    # Handle empty graph
-    if not graph.nodes:
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{_escape_html(page_title)}</title>
-{_generate_css()}
-</head>
-<body>
-  <h1>Sentinel Energy Graph</h1>
+    # Collision warning cards if paths provided
+    write(_generate_collision_cards(collision_paths or []))
+    write(f"""
   <div class="graph-container">
-    <div class="empty-state">
-      <p>No data available. Import your schedule to visualize your energy graph.</p>
-    </div>
-  </div>
-  <footer>
-    <p>Generated by Sentinel at {timestamp}</p>
-  </footer>
-</body>
-</html>"""
+  <svg {_SVG_ATTRS}>
+{_SVG_DEFS}
+    <!-- Edges -->
+""")
 
-    # Generate edges first (so they render behind nodes)
-    edge_svgs: list[str] = []
+    # Edges first (so they render behind nodes)
     for edge in graph.edges:
         # Check if edge is part of collision path (O(1) lookup)
         source_node = nodes_by_id.get(edge.source_id)
@@ -409,47 +454,17 @@ def render_html(
         if source_node and target_node:
             is_collision = (source_node.label, target_node.label) in collision_edges
 
-        edge_svg = _generate_edge_svg(edge, positions, is_collision=is_collision)
-        if edge_svg:
-            edge_svgs.append(edge_svg)
+        write(_generate_edge_svg(edge, positions, is_collision=is_collision))
 
-    # Generate nodes
-    node_svgs: list[str] = []
+    write("\n    <!-- Nodes -->\n")
     for node in graph.nodes:
         if node.id in positions:
             x, y = positions[node.id]
             is_collision = node.label in collision_labels
-            node_svg = _generate_node_svg(node, x, y, is_collision=is_collision)
-            node_svgs.append(node_svg)
-
-    # Combine SVG
-    viewbox = f"0 0 {SVG_WIDTH} {SVG_HEIGHT}"
-    svg_attrs = f'viewBox="{viewbox}" width="{SVG_WIDTH}" height="{SVG_HEIGHT}"'
-    svg_content = f"""  <svg {svg_attrs}>
-{_generate_svg_defs()}
-    <!-- Edges -->
-{"".join(edge_svgs)}
-    <!-- Nodes -->
-{"".join(node_svgs)}
-  </svg>"""
+            write(_generate_node_svg(node, x, y, is_collision=is_collision))
 
-    # Generate collision warning cards if paths provided
-    collision_cards_html = _generate_collision_cards(collision_paths or [])
-
-    # Build complete HTML
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{_escape_html(page_title)}</title>
-{_generate_css()}
-</head>
-<body>
-  <h1>Sentinel Energy Graph</h1>
-{collision_cards_html}
-  <div class="graph-container">
-{svg_content}
+    write(f"""
+  </svg>
   </div>
   <div class="legend">
     <span class="legend-item">
@@ -470,6 +485,94 @@ def render_html(
     <p>Nodes: {len(graph.nodes)} | Relationships: {len(graph.edges)}</p>
   </footer>
 </body>
-</html>"""
+</html>""")
+
+
+def render_html(
+    graph: Graph,
+    collision_paths: list[tuple[str, ...]] | None = None,
+    title: str | None = None,
+) -> str:
+    """Generate self-contained HTML with SVG graph visualization.
 
-    return html
+    Args:
+        graph: Sentinel Graph to visualize.
+        collision_paths: Optional list of collision path tuples for highlighting.
+        title: Optional custom title for the HTML page.
+
+    Returns:
+        Complete HTML document as a string.
+    """
+    buf = io.StringIO()
+    _render_into(buf, graph, collision_paths=collision_paths, title=title)
+    return buf.getvalue()
+
+
+def render_html_to_file(
+    graph: Graph,
+    path: str | os.PathLike[str],
+    collision_paths: list[tuple[str, ...]] | None = None,
+    title: str | None = None,
+) -> None:
+    """Write self-contained HTML with SVG graph visualization to a file.
+
+    Streams the document to a uniquely named temp file next to ``path``
+    instead of building it in memory first, which keeps peak memory flat for
+    large graphs. The temp file only replaces ``path`` once rendering has
+    finished, so a failed render leaves any existing file untouched.
+
+    A symlinked ``path`` is resolved first, so the link survives and its
+    target is updated; an existing file keeps its permission bits. Targets
+    that are not regular files, such as ``/dev/stdout`` or a FIFO, cannot be
+    swapped out and are written to directly.
+
+    Args:
+        graph: Sentinel Graph to visualize.
+        path: Destination file path (overwritten if it exists).
+        collision_paths: Optional list of collision path tuples for highlighting.
+        title: Optional custom title for the HTML page.
+
+    Raises:
+        OSError: If the file cannot be opened or written.
+    """
+    target = os.path.realpath(path)
+    try:
+        target_stat: os.stat_result | None = os.stat(target)
+    except FileNotFoundError:
+        target_stat = None
+
+    if target_stat is not None and not stat.S_ISREG(target_stat.st_mode):
+        with open(target, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            _render_into(f, graph, collision_paths=collision_paths, title=title)
+        return
+
+    if target_stat is not None:
+        mode = stat.S_IMODE(target_stat.st_mode)
+    else:
+        # NamedTemporaryFile creates 0600; give a new file open()'s default instead
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    directory, name = os.path.split(target)
+    temp_file = tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        buffering=_WRITE_BUFFER_SIZE,
+        dir=directory,
+        prefix=f"{name}.",
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with temp_file as f:
+            _render_into(f, graph, collision_paths=collision_paths, title=title)
+        os.chmod(temp_file.name, mode)
+        os.replace(temp_file.name, target)
+    except BaseException:
+        # Clean up temp file if rendering or the rename failed
+        try:
+            os.unlink(temp_file.name)
+        except OSError:
+            pass
+        raise
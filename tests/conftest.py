@@ -4,13 +4,19 @@ This module contains the MockEngine implementation and fixtures
 for testing Sentinel without requiring LLM calls.
 """
 
+import contextlib
+import io
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from click.testing import CliRunner
 
-from sentinel.core.engine import Subgraph
+from sentinel.cli.commands import main
+from sentinel.core.constants import EXIT_SUCCESS
+from sentinel.core.engine import CogneeEngine, Subgraph
 from sentinel.core.types import Correction, Edge, Graph, Node, ScoredCollision
 
 # Fixture directory path
@@ -49,6 +55,279 @@ def mock_api_key_for_non_live_tests(request: pytest.FixtureRequest) -> Generator
         os.environ["LLM_API_KEY"] = original_key
 
 
+# MockEngine fixture graphs, built once at import. Graph/Node/Edge are frozen
+# dataclasses, so ingest() can hand out the same instances on every call.
+
+# Collision scenario (typical week)
+_COLLISION_NODES = (
+    Node(
+        id="person-aunt-susan",
+        label="Aunt Susan",
+        type="Person",
+        source="user-stated",
+        metadata={"extracted_from": "Sunday dinner"},
+    ),
+    Node(
+        id="activity-dinner",
+        label="Dinner with Aunt Susan",
+        type="Activity",
+        source="user-stated",
+        metadata={"day": "Sunday"},
+    ),
+    Node(
+        id="energy-low",
+        label="Low Energy",
+        type="EnergyState",
+        source="ai-inferred",
+        metadata={"level": "depleted"},
+    ),
+    Node(
+        id="energy-high",
+        label="High Focus Required",
+        type="EnergyState",
+        source="ai-inferred",
+        metadata={"level": "peak"},
+    ),
+    Node(
+        id="activity-presentation",
+        label="Strategy Presentation",
+        type="Activity",
+        source="user-stated",
+        metadata={"day": "Monday"},
+    ),
+    Node(
+        id="timeslot-sunday-evening",
+        label="Sunday Evening",
+        type="TimeSlot",
+        source="ai-inferred",
+        metadata={"day": "Sunday", "time": "evening"},
+    ),
+    Node(
+        id="timeslot-monday-morning",
+        label="Monday Morning",
+        type="TimeSlot",
+        source="ai-inferred",
+        metadata={"day": "Monday", "time": "morning"},
+    ),
+)
+
+# Include boundary confidence values for testing thresholds
+_COLLISION_EDGES = (
+    Edge(
+        source_id="person-aunt-susan",
+        target_id="energy-low",
+        relationship="DRAINS",
+        confidence=0.81,  # Boundary: just above HIGH_CONFIDENCE
+        metadata={"reason": "emotionally draining"},
+    ),
+    Edge(
+        source_id="activity-dinner",
+        target_id="person-aunt-susan",
+        relationship="INVOLVES",
+        confidence=0.80,  # Boundary: exactly HIGH_CONFIDENCE
+        metadata={},
+    ),
+    Edge(
+        source_id="energy-low",
+        target_id="energy-high",
+        relationship="CONFLICTS_WITH",
+        confidence=0.79,  # Boundary: just below HIGH_CONFIDENCE
+        metadata={"conflict_type": "energy_depletion"},
+    ),
+    Edge(
+        source_id="activity-presentation",
+        target_id="energy-high",
+        relationship="REQUIRES",
+        confidence=0.51,  # Boundary: just above MEDIUM_CONFIDENCE
+        metadata={"requirement": "mental_sharpness"},
+    ),
+    Edge(
+        source_id="activity-dinner",
+        target_id="timeslot-sunday-evening",
+        relationship="SCHEDULED_AT",
+        confidence=0.50,  # Boundary: exactly MEDIUM_CONFIDENCE
+        metadata={},
+    ),
+    Edge(
+        source_id="activity-presentation",
+        target_id="timeslot-monday-morning",
+        relationship="SCHEDULED_AT",
+        confidence=0.49,  # Boundary: just below MEDIUM_CONFIDENCE
+        metadata={},
+    ),
+)
+_COLLISION_GRAPH = Graph(nodes=_COLLISION_NODES, edges=_COLLISION_EDGES)
+
+
+# No collision scenario (boring week)
+_BORING_NODES = (
+    Node(
+        id="activity-standup",
+        label="Regular Standup",
+        type="Activity",
+        source="user-stated",
+        metadata={"day": "Monday"},
+    ),
+    Node(
+        id="activity-docs",
+        label="Documentation Updates",
+        type="Activity",
+        source="user-stated",
+        metadata={"day": "Tuesday"},
+    ),
+    Node(
+        id="activity-lunch",
+        label="Team Lunch",
+        type="Activity",
+        source="user-stated",
+        metadata={"day": "Wednesday"},
+    ),
+    Node(
+        id="timeslot-monday",
+        label="Monday",
+        type="TimeSlot",
+        source="ai-inferred",
+        metadata={"day": "Monday"},
+    ),
+    Node(
+        id="timeslot-tuesday",
+        label="Tuesday",
+        type="TimeSlot",
+        source="ai-inferred",
+        metadata={"day": "Tuesday"},
+    ),
+    Node(
+        id="timeslot-wednesday",
+        label="Wednesday",
+        type="TimeSlot",
+        source="ai-inferred",
+        metadata={"day": "Wednesday"},
+    ),
+)
+
+# No DRAINS relationships - just scheduling
+_BORING_EDGES = (
+    Edge(
+        source_id="activity-standup",
+        target_id="timeslot-monday",
+        relationship="SCHEDULED_AT",
+        confidence=0.90,
+        metadata={},
+    ),
+    Edge(
+        source_id="activity-docs",
+        target_id="timeslot-tuesday",
+        relationship="SCHEDULED_AT",
+        confidence=0.90,
+        metadata={},
+    ),
+    Edge(
+        source_id="activity-lunch",
+        target_id="timeslot-wednesday",
+        relationship="SCHEDULED_AT",
+        confidence=0.90,
+        metadata={},
+    ),
+)
+_BORING_GRAPH = Graph(nodes=_BORING_NODES, edges=_BORING_EDGES)
+
+
+# Unicode characters preserved (edge cases)
+_UNICODE_NODES = (
+    Node(
+        id="person-maria",
+        label="María ☕",
+        type="Person",
+        source="user-stated",
+        metadata={"extracted_from": "coffee meeting"},
+    ),
+    Node(
+        id="person-jean-pierre",
+        label="Jean-Pierre",
+        type="Person",
+        source="user-stated",
+        metadata={"extracted_from": "über-important project"},
+    ),
+    Node(
+        id="activity-coffee",
+        label="Coffee with María ☕",
+        type="Activity",
+        source="user-stated",
+        metadata={"day": "Monday"},
+    ),
+    Node(
+        id="activity-meeting",
+        label="über-important project meeting",
+        type="Activity",
+        source="user-stated",
+        metadata={"day": "Tuesday"},
+    ),
+    Node(
+        id="activity-japanese",
+        label="日本語テスト",
+        type="Activity",
+        source="user-stated",
+        metadata={"day": "Wednesday"},
+    ),
+)
+
+_UNICODE_EDGES = (
+    Edge(
+        source_id="activity-coffee",
+        target_id="person-maria",
+        relationship="INVOLVES",
+        confidence=0.85,
+        metadata={},
+    ),
+    Edge(
+        source_id="activity-meeting",
+        target_id="person-jean-pierre",
+        relationship="INVOLVES",
+        confidence=0.85,
+        metadata={},
+    ),
+)
+_UNICODE_GRAPH = Graph(nodes=_UNICODE_NODES, edges=_UNICODE_EDGES)
+
+# Canonical SOCIAL → PROFESSIONAL collision shared via cross_domain_graph
+_CROSS_DOMAIN_GRAPH = Graph(
+    nodes=(
+        Node(id="person-aunt-susan", label="Aunt Susan", type="Person", source="user-stated"),
+        Node(id="energystate-drained", label="drained", type="EnergyState", source="ai-inferred"),
+        Node(id="energystate-focused", label="focused", type="EnergyState", source="ai-inferred"),
+        Node(
+            id="activity-presentation",
+            label="Strategy Presentation",
+            type="Activity",
+            source="user-stated",
+        ),
+    ),
+    edges=(
+        Edge(
+            source_id="person-aunt-susan",
+            target_id="energystate-drained",
+            relationship="DRAINS",
+            confidence=0.85,
+        ),
+        Edge(
+            source_id="energystate-drained",
+            target_id="energystate-focused",
+            relationship="CONFLICTS_WITH",
+            confidence=0.80,
+        ),
+        Edge(
+            source_id="activity-presentation",
+            target_id="energystate-focused",
+            relationship="REQUIRES",
+            confidence=0.90,
+        ),
+    ),
+)
+
+# Stand-in for path elements whose node is missing from the graph
+_UNKNOWN_NODE = Node(id="", label="?", type="", source="ai-inferred")
+
+
 class MockEngine:
     """Mock implementation of GraphEngine for deterministic testing.
 
@@ -85,238 +364,15 @@ class MockEngine:
 
     def _create_collision_graph(self, text: str) -> Graph:
         """Create a graph with collision scenario (typical week)."""
-        nodes = [
-            Node(
-                id="person-aunt-susan",
-                label="Aunt Susan",
-                type="Person",
-                source="user-stated",
-                metadata={"extracted_from": "Sunday dinner"},
-            ),
-            Node(
-                id="activity-dinner",
-                label="Dinner with Aunt Susan",
-                type="Activity",
-                source="user-stated",
-                metadata={"day": "Sunday"},
-            ),
-            Node(
-                id="energy-low",
-                label="Low Energy",
-                type="EnergyState",
-                source="ai-inferred",
-                metadata={"level": "depleted"},
-            ),
-            Node(
-                id="energy-high",
-                label="High Focus Required",
-                type="EnergyState",
-                source="ai-inferred",
-                metadata={"level": "peak"},
-            ),
-            Node(
-                id="activity-presentation",
-                label="Strategy Presentation",
-                type="Activity",
-                source="user-stated",
-                metadata={"day": "Monday"},
-            ),
-            Node(
-                id="timeslot-sunday-evening",
-                label="Sunday Evening",
-                type="TimeSlot",
-                source="ai-inferred",
-                metadata={"day": "Sunday", "time": "evening"},
-            ),
-            Node(
-                id="timeslot-monday-morning",
-                label="Monday Morning",
-                type="TimeSlot",
-                source="ai-inferred",
-                metadata={"day": "Monday", "time": "morning"},
-            ),
-        ]
-
-        # Include boundary confidence values for testing thresholds
-        edges = [
-            Edge(
-                source_id="person-aunt-susan",
-                target_id="energy-low",
-                relationship="DRAINS",
-                confidence=0.81,  # Boundary: just above HIGH_CONFIDENCE
-                metadata={"reason": "emotionally draining"},
-            ),
-            Edge(
-                source_id="activity-dinner",
-                target_id="person-aunt-susan",
-                relationship="INVOLVES",
-                confidence=0.80,  # Boundary: exactly HIGH_CONFIDENCE
-                metadata={},
-            ),
-            Edge(
-                source_id="energy-low",
-                target_id="energy-high",
-                relationship="CONFLICTS_WITH",
-                confidence=0.79,  # Boundary: just below HIGH_CONFIDENCE
-                metadata={"conflict_type": "energy_depletion"},
-            ),
-            Edge(
-                source_id="activity-presentation",
-                target_id="energy-high",
-                relationship="REQUIRES",
-                confidence=0.51,  # Boundary: just above MEDIUM_CONFIDENCE
-                metadata={"requirement": "mental_sharpness"},
-            ),
-            Edge(
-                source_id="activity-dinner",
-                target_id="timeslot-sunday-evening",
-                relationship="SCHEDULED_AT",
-                confidence=0.50,  # Boundary: exactly MEDIUM_CONFIDENCE
-                metadata={},
-            ),
-            Edge(
-                source_id="activity-presentation",
-                target_id="timeslot-monday-morning",
-                relationship="SCHEDULED_AT",
-                confidence=0.49,  # Boundary: just below MEDIUM_CONFIDENCE
-                metadata={},
-            ),
-        ]
-
-        return Graph(nodes=tuple(nodes), edges=tuple(edges))
+        return _COLLISION_GRAPH
 
     def _create_boring_graph(self, text: str) -> Graph:
         """Create a graph without collision scenario (boring week)."""
-        nodes = [
-            Node(
-                id="activity-standup",
-                label="Regular Standup",
-                type="Activity",
-                source="user-stated",
-                metadata={"day": "Monday"},
-            ),
-            Node(
-                id="activity-docs",
-                label="Documentation Updates",
-                type="Activity",
-                source="user-stated",
-                metadata={"day": "Tuesday"},
-            ),
-            Node(
-                id="activity-lunch",
-                label="Team Lunch",
-                type="Activity",
-                source="user-stated",
-                metadata={"day": "Wednesday"},
-            ),
-            Node(
-                id="timeslot-monday",
-                label="Monday",
-                type="TimeSlot",
-                source="ai-inferred",
-                metadata={"day": "Monday"},
-            ),
-            Node(
-                id="timeslot-tuesday",
-                label="Tuesday",
-                type="TimeSlot",
-                source="ai-inferred",
-                metadata={"day": "Tuesday"},
-            ),
-            Node(
-                id="timeslot-wednesday",
-                label="Wednesday",
-                type="TimeSlot",
-                source="ai-inferred",
-                metadata={"day": "Wednesday"},
-            ),
-        ]
-
-        # No DRAINS relationships - just scheduling
-        edges = [
-            Edge(
-                source_id="activity-standup",
-                target_id="timeslot-monday",
-                relationship="SCHEDULED_AT",
-                confidence=0.90,
-                metadata={},
-            ),
-            Edge(
-                source_id="activity-docs",
-                target_id="timeslot-tuesday",
-                relationship="SCHEDULED_AT",
-                confidence=0.90,
-                metadata={},
-            ),
-            Edge(
-                source_id="activity-lunch",
-                target_id="timeslot-wednesday",
-                relationship="SCHEDULED_AT",
-                confidence=0.90,
-                metadata={},
-            ),
-        ]
-
-        return Graph(nodes=tuple(nodes), edges=tuple(edges))
+        return _BORING_GRAPH
 
     def _create_unicode_graph(self, text: str) -> Graph:
         """Create a graph preserving Unicode characters (edge cases)."""
-        nodes = [
-            Node(
-                id="person-maria",
-                label="María ☕",
-                type="Person",
-                source="user-stated",
-                metadata={"extracted_from": "coffee meeting"},
-            ),
-            Node(
-                id="person-jean-pierre",
-                label="Jean-Pierre",
-                type="Person",
-                source="user-stated",
-                metadata={"extracted_from": "über-important project"},
-            ),
-            Node(
-                id="activity-coffee",
-                label="Coffee with María ☕",
-                type="Activity",
-                source="user-stated",
-                metadata={"day": "Monday"},
-            ),
-            Node(
-                id="activity-meeting",
-                label="über-important project meeting",
-                type="Activity",
-                source="user-stated",
-                metadata={"day": "Tuesday"},
-            ),
-            Node(
-                id="activity-japanese",
-                label="日本語テスト",
-                type="Activity",
-                source="user-stated",
-                metadata={"day": "Wednesday"},
-            ),
-        ]
-
-        edges = [
-            Edge(
-                source_id="activity-coffee",
-                target_id="person-maria",
-                relationship="INVOLVES",
-                confidence=0.85,
-                metadata={},
-            ),
-            Edge(
-                source_id="activity-meeting",
-                target_id="person-jean-pierre",
-                relationship="INVOLVES",
-                confidence=0.85,
-                metadata={},
-            ),
-        ]
-
-        return Graph(nodes=tuple(nodes), edges=tuple(edges))
+        return _UNICODE_GRAPH
 
     async def query_collisions(self, graph: Graph) -> list[ScoredCollision]:
         """Detect collisions in the graph.
@@ -337,6 +393,8 @@ class MockEngine:
         if not drains_edges:
             return collisions
 
+        nodes_by_id = graph.by_id
+
         # Build collision path
         for drain_edge in drains_edges:
             # Find connected CONFLICTS_WITH edge
@@ -356,26 +414,16 @@ class MockEngine:
 
                 for requires_edge in requires:
                     # Build path labels
-                    source_node = next(
-                        (n for n in graph.nodes if n.id == drain_edge.source_id), None
-                    )
-                    target_node = next(
-                        (n for n in graph.nodes if n.id == requires_edge.source_id), None
-                    )
+                    source_node = nodes_by_id.get(drain_edge.source_id)
+                    target_node = nodes_by_id.get(requires_edge.source_id)
 
                     if source_node and target_node:
                         path = [
                             source_node.label,
                             "DRAINS",
-                            next(
-                                (n.label for n in graph.nodes if n.id == drain_edge.target_id),
-                                "?",
-                            ),
+                            nodes_by_id.get(drain_edge.target_id, _UNKNOWN_NODE).label,
                             "CONFLICTS_WITH",
-                            next(
-                                (n.label for n in graph.nodes if n.id == conflict_edge.target_id),
-                                "?",
-                            ),
+                            nodes_by_id.get(conflict_edge.target_id, _UNKNOWN_NODE).label,
                             "REQUIRES",
                             target_node.label,
                         ]
@@ -479,28 +527,114 @@ class MockEngine:
         return self._stored_graph
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def maya_typical_week_text() -> str:
-    """Load maya_typical_week.txt fixture text."""
+    """Load maya_typical_week.txt fixture text once per session."""
     fixture_path = FIXTURES_DIR / "maya_typical_week.txt"
     return fixture_path.read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def maya_boring_week_text() -> str:
-    """Load maya_boring_week.txt fixture text."""
+    """Load maya_boring_week.txt fixture text once per session."""
     fixture_path = FIXTURES_DIR / "maya_boring_week.txt"
     return fixture_path.read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def maya_edge_cases_text() -> str:
-    """Load maya_edge_cases.txt fixture text."""
+    """Load maya_edge_cases.txt fixture text once per session."""
     fixture_path = FIXTURES_DIR / "maya_edge_cases.txt"
     return fixture_path.read_text(encoding="utf-8")
 
 
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Provide one CliRunner shared by every test in the session.
+
+    CliRunner keeps no state between invoke() calls. A module that needs a
+    differently configured runner defines it under its own fixture name rather
+    than overriding this one.
+    """
+    return CliRunner()
+
+
 @pytest.fixture
 def mock_engine() -> MockEngine:
     """Provide a MockEngine instance for testing."""
     return MockEngine()
+
+
+def _invoke_cli(*args: str) -> tuple[int, str]:
+    """Run `sentinel *args` in-process through main.main().
+
+    Cheaper than CliRunner.invoke for tests that only need the exit code and
+    output, while still going through Click's parsing and the main group
+    callback. stdout and stderr are captured together, as CliRunner does.
+
+    Args:
+        args: Command-line arguments, e.g. ("--verbose", "check").
+
+    Returns:
+        Tuple of (exit code, combined stdout/stderr output).
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        try:
+            main.main(list(args), standalone_mode=False)
+        except SystemExit as e:
+            return int(e.code or 0), buffer.getvalue()
+    return EXIT_SUCCESS, buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def invoke_cli() -> Callable[..., tuple[int, str]]:
+    """Provide the in-process CLI runner; call it with the sentinel arguments."""
+    return _invoke_cli
+
+
+@pytest.fixture
+def saved_graph(monkeypatch: pytest.MonkeyPatch) -> Callable[[Graph | None], None]:
+    """Stub CogneeEngine.load; call the returned setter with the graph to serve.
+
+    Pass None to simulate having no saved schedule data.
+    """
+
+    def _set(graph: Graph | None) -> None:
+        monkeypatch.setattr(CogneeEngine, "load", lambda self, **kwargs: graph)
+
+    return _set
+
+
+MockEngineFactory = Callable[..., MagicMock]
+
+
+@pytest.fixture
+def make_mock_engine() -> MockEngineFactory:
+    """Provide a factory for MagicMock engines that serve a fixed graph.
+
+    ``make_mock_engine(graph)`` returns the graph from ``load()``, for check-style
+    commands. With ``ingest=True`` it comes from an async ``ingest()`` instead,
+    with a no-op ``persist()``, for paste-style commands.
+    """
+
+    def _make(graph: Graph, *, ingest: bool = False) -> MagicMock:
+        engine = MagicMock()
+        if ingest:
+            engine.ingest = AsyncMock(return_value=graph)
+            engine.persist = MagicMock()
+        else:
+            engine.load = MagicMock(return_value=graph)
+        return engine
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def cross_domain_graph() -> Graph:
+    """Provide the SOCIAL → PROFESSIONAL collision graph, shared across the session.
+
+    (Aunt Susan)-[:DRAINS]->(drained)-[:CONFLICTS_WITH]->(focused)<-[:REQUIRES]-
+    (Strategy Presentation)
+    """
+    return _CROSS_DOMAIN_GRAPH
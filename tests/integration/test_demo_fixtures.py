@@ -9,10 +9,12 @@ Test Architect: Story 5.6 - Demo Fixtures & CI/CD
 Risk Level: HIGH - Demo failure = credibility loss at competition
 """
 
+import re
+import tomllib
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
-import pytest
 from click.testing import CliRunner
 
 from sentinel.cli.commands import main
@@ -25,6 +27,39 @@ TYPICAL_WEEK = FIXTURES_DIR / "maya_typical_week.txt"
 BORING_WEEK = FIXTURES_DIR / "maya_boring_week.txt"
 EDGE_CASES = FIXTURES_DIR / "maya_edge_cases.txt"
 
+MockEngineFactory = Callable[..., MagicMock]
+
+# Energy-draining scenario markers expected in the typical week
+_DRAINING_RE = re.compile(r"aunt susan|draining", re.IGNORECASE)
+
+# One collision-free graph for tests that only need the engine to return something.
+# Graph and Node are frozen, so a single instance is shared.
+_SIMPLE_ACTIVITY_GRAPH = Graph(
+    nodes=(Node(id="test", label="Test Activity", type="Activity", source="user-stated"),),
+    edges=(),
+)
+
+
+def _paste_and_capture(runner: CliRunner, content: str, mock_engine: MagicMock) -> str:
+    """Run ``sentinel paste`` with content and return the text handed to ingest.
+
+    Args:
+        runner: Click test runner.
+        content: Schedule text piped to stdin.
+        mock_engine: Engine mock (from make_mock_engine with ingest=True).
+
+    Returns:
+        The first positional argument of the single ingest call.
+    """
+    with patch("sentinel.core.engine.CogneeEngine", return_value=mock_engine):
+        result = runner.invoke(main, ["paste"], input=content, catch_exceptions=False)
+
+    assert result.exit_code == EXIT_SUCCESS, (
+        f"Paste with fixture content should succeed. Output: {result.output}"
+    )
+    mock_engine.ingest.assert_called_once()
+    return mock_engine.ingest.call_args[0][0]
+
 
 class TestDemoFixturesExist:
     """[P0] Verify demo fixture files exist and have content."""
@@ -34,48 +69,45 @@ class TestDemoFixturesExist:
         assert FIXTURES_DIR.exists(), f"Fixtures directory not found at {FIXTURES_DIR}"
         assert FIXTURES_DIR.is_dir()
 
-    def test_typical_week_fixture_exists(self) -> None:
+    def test_typical_week_fixture_exists(self, maya_typical_week_text: str) -> None:
         """maya_typical_week.txt exists with collision-triggering content."""
         assert TYPICAL_WEEK.exists(), f"maya_typical_week.txt not found at {TYPICAL_WEEK}"
-        content = TYPICAL_WEEK.read_text()
         # Fixture must have meaningful content (at least a schedule entry)
-        assert content.strip(), "Fixture should have content"
+        assert maya_typical_week_text.strip(), "Fixture should have content"
         # Should contain draining scenario keywords
-        assert "aunt susan" in content.lower() or "draining" in content.lower(), (
+        assert _DRAINING_RE.search(maya_typical_week_text), (
             "Typical week should mention energy-draining interaction"
         )
 
-    def test_boring_week_fixture_exists(self) -> None:
+    def test_boring_week_fixture_exists(self, maya_boring_week_text: str) -> None:
         """maya_boring_week.txt exists with no collision content."""
         assert BORING_WEEK.exists(), f"maya_boring_week.txt not found at {BORING_WEEK}"
-        content = BORING_WEEK.read_text()
-        assert len(content) > 20, "Fixture should have some content"
+        assert len(maya_boring_week_text) > 20, "Fixture should have some content"
         # Should NOT contain draining keywords
-        assert "draining" not in content.lower(), (
+        assert "draining" not in maya_boring_week_text.lower(), (
             "Boring week should not have energy-draining content"
         )
 
-    def test_edge_cases_fixture_exists(self) -> None:
+    def test_edge_cases_fixture_exists(self, maya_edge_cases_text: str) -> None:
         """maya_edge_cases.txt exists with Unicode/emoji content."""
         assert EDGE_CASES.exists(), f"maya_edge_cases.txt not found at {EDGE_CASES}"
-        content = EDGE_CASES.read_text()
         # Should contain non-ASCII characters
-        has_unicode = any(ord(c) > 127 for c in content)
+        has_unicode = not maya_edge_cases_text.isascii()
         assert has_unicode, "Edge cases should contain Unicode characters (emoji, accents)"
 
 
 class TestTypicalWeekCollision:
     """[P0] maya_typical_week.txt produces collision."""
 
-    def test_typical_week_mock_produces_collision(self) -> None:
+    def test_typical_week_mock_produces_collision(
+        self, runner: CliRunner, make_mock_engine: MockEngineFactory
+    ) -> None:
         """Typical week scenario triggers collision detection with MockEngine.
 
         GIVEN: maya_typical_week.txt content with Aunt Susan scenario
         WHEN: Processed through sentinel check
         THEN: At least one collision is detected
         """
-        runner = CliRunner()
-
         # Mock graph with collision pattern
         nodes = (
             Node(id="aunt-susan", label="Aunt Susan", type="Person", source="user-stated"),
@@ -107,8 +139,7 @@ class TestTypicalWeekCollision:
         )
         graph = Graph(nodes=nodes, edges=edges)
 
-        mock_engine = MagicMock()
-        mock_engine.load = MagicMock(return_value=graph)
+        mock_engine = make_mock_engine(graph)
 
         with patch("sentinel.core.engine.CogneeEngine", return_value=mock_engine):
             result = runner.invoke(main, ["check"], catch_exceptions=False)
@@ -123,15 +154,15 @@ class TestTypicalWeekCollision:
 class TestBoringWeekNoCollision:
     """[P0] maya_boring_week.txt shows graceful empty state."""
 
-    def test_boring_week_mock_no_collision(self) -> None:
+    def test_boring_week_mock_no_collision(
+        self, runner: CliRunner, make_mock_engine: MockEngineFactory
+    ) -> None:
         """Boring week scenario shows no collision with graceful message.
 
         GIVEN: maya_boring_week.txt content with no draining activities
         WHEN: Processed through sentinel check
         THEN: Graceful "no collisions" message displays
         """
-        runner = CliRunner()
-
         # Graph without collision pattern
         nodes = (
             Node(id="standup", label="Team Standup", type="Activity", source="user-stated"),
@@ -144,8 +175,7 @@ class TestBoringWeekNoCollision:
         )
         graph = Graph(nodes=nodes, edges=edges)
 
-        mock_engine = MagicMock()
-        mock_engine.load = MagicMock(return_value=graph)
+        mock_engine = make_mock_engine(graph)
 
         with patch("sentinel.core.engine.CogneeEngine", return_value=mock_engine):
             result = runner.invoke(main, ["check"], catch_exceptions=False)
@@ -154,37 +184,32 @@ class TestBoringWeekNoCollision:
                 f"Expected success (exit code 0). Got {result.exit_code}. Output: {result.output}"
             )
             # Should show positive empty state message
-            assert "no" in result.output.lower() and "collision" in result.output.lower()
+            output_lower = result.output.lower()
+            assert "no" in output_lower and "collision" in output_lower
 
 
 class TestEdgeCasesNoCrash:
     """[P0] maya_edge_cases.txt processes without crash."""
 
-    def test_edge_cases_file_readable(self) -> None:
+    def test_edge_cases_file_readable(self, maya_edge_cases_text: str) -> None:
         """Edge cases file can be read without encoding errors."""
-        content = EDGE_CASES.read_text(encoding="utf-8")
-        assert len(content) > 0
+        assert len(maya_edge_cases_text) > 0
 
-    def test_edge_cases_mock_no_crash(self) -> None:
+    def test_edge_cases_mock_no_crash(
+        self, runner: CliRunner, maya_edge_cases_text: str, make_mock_engine: MockEngineFactory
+    ) -> None:
         """Edge cases content processes without crash (NFR13).
 
         GIVEN: maya_edge_cases.txt with Unicode, emoji, accented characters
         WHEN: Processed through sentinel paste
         THEN: No crashes occur from special characters
         """
-        runner = CliRunner()
-        content = EDGE_CASES.read_text()
-
-        # Simple graph return (doesn't need collision pattern)
-        nodes = (Node(id="cafe", label="Coffee with Maria", type="Activity", source="user-stated"),)
-        graph = Graph(nodes=nodes, edges=())
-
-        mock_engine = MagicMock()
-        mock_engine.ingest = AsyncMock(return_value=graph)
-        mock_engine.persist = MagicMock()
+        mock_engine = make_mock_engine(_SIMPLE_ACTIVITY_GRAPH, ingest=True)
 
         with patch("sentinel.core.engine.CogneeEngine", return_value=mock_engine):
-            result = runner.invoke(main, ["paste"], input=content, catch_exceptions=False)
+            result = runner.invoke(
+                main, ["paste"], input=maya_edge_cases_text, catch_exceptions=False
+            )
 
             # Should not crash - exit code 0 for success
             assert result.exit_code == EXIT_SUCCESS, (
@@ -195,16 +220,18 @@ class TestEdgeCasesNoCrash:
 class TestFixtureContentIntegration:
     """[P0] Tests that validate actual fixture content flows through CLI."""
 
-    def test_typical_week_content_triggers_ingest(self) -> None:
+    def test_typical_week_content_triggers_ingest(
+        self,
+        runner: CliRunner,
+        maya_typical_week_text: str,
+        make_mock_engine: MockEngineFactory,
+    ) -> None:
         """Actual maya_typical_week.txt content is passed to ingest.
 
         GIVEN: Real content from maya_typical_week.txt
         WHEN: Passed through sentinel paste
         THEN: The ingest receives the actual fixture content
         """
-        runner = CliRunner()
-        fixture_content = TYPICAL_WEEK.read_text()
-
         # Graph that would result from collision scenario
         nodes = (
             Node(id="aunt-susan", label="Aunt Susan", type="Person", source="user-stated"),
@@ -212,106 +239,77 @@ class TestFixtureContentIntegration:
         )
         graph = Graph(nodes=nodes, edges=())
 
-        mock_engine = MagicMock()
-        mock_engine.ingest = AsyncMock(return_value=graph)
-        mock_engine.persist = MagicMock()
-
-        with patch("sentinel.core.engine.CogneeEngine", return_value=mock_engine):
-            result = runner.invoke(main, ["paste"], input=fixture_content, catch_exceptions=False)
+        call_args = _paste_and_capture(
+            runner, maya_typical_week_text, make_mock_engine(graph, ingest=True)
+        )
 
-            assert result.exit_code == EXIT_SUCCESS, (
-                f"Paste with fixture content should succeed. Output: {result.output}"
-            )
-            # Verify ingest was called with the actual fixture content
-            mock_engine.ingest.assert_called_once()
-            call_args = mock_engine.ingest.call_args[0][0]
-            assert "aunt susan" in call_args.lower() or "draining" in call_args.lower(), (
-                f"Ingest should receive fixture content. Got: {call_args[:100]}..."
-            )
+        assert _DRAINING_RE.search(call_args), (
+            f"Ingest should receive fixture content. Got: {call_args[:100]}..."
+        )
 
-    def test_boring_week_content_triggers_ingest(self) -> None:
+    def test_boring_week_content_triggers_ingest(
+        self,
+        runner: CliRunner,
+        maya_boring_week_text: str,
+        make_mock_engine: MockEngineFactory,
+    ) -> None:
         """Actual maya_boring_week.txt content is passed to ingest.
 
         GIVEN: Real content from maya_boring_week.txt
         WHEN: Passed through sentinel paste
         THEN: The ingest receives the boring week content (no draining keywords)
         """
-        runner = CliRunner()
-        fixture_content = BORING_WEEK.read_text()
-
-        nodes = (Node(id="standup", label="Team Standup", type="Activity", source="user-stated"),)
-        graph = Graph(nodes=nodes, edges=())
-
-        mock_engine = MagicMock()
-        mock_engine.ingest = AsyncMock(return_value=graph)
-        mock_engine.persist = MagicMock()
+        call_args = _paste_and_capture(
+            runner, maya_boring_week_text, make_mock_engine(_SIMPLE_ACTIVITY_GRAPH, ingest=True)
+        )
 
-        with patch("sentinel.core.engine.CogneeEngine", return_value=mock_engine):
-            result = runner.invoke(main, ["paste"], input=fixture_content, catch_exceptions=False)
-
-            assert result.exit_code == EXIT_SUCCESS
-            mock_engine.ingest.assert_called_once()
-            call_args = mock_engine.ingest.call_args[0][0]
-            # Boring week should NOT have draining content
-            assert "draining" not in call_args.lower(), (
-                f"Boring week should not have draining content. Got: {call_args[:100]}..."
-            )
+        # Boring week should NOT have draining content
+        assert "draining" not in call_args.lower(), (
+            f"Boring week should not have draining content. Got: {call_args[:100]}..."
+        )
 
-    def test_edge_cases_unicode_content_preserved(self) -> None:
+    def test_edge_cases_unicode_content_preserved(
+        self,
+        runner: CliRunner,
+        maya_edge_cases_text: str,
+        make_mock_engine: MockEngineFactory,
+    ) -> None:
         """Unicode content from maya_edge_cases.txt is preserved through CLI.
 
         GIVEN: Real content from maya_edge_cases.txt with Unicode/emoji
         WHEN: Passed through sentinel paste
         THEN: Unicode characters are preserved in the content passed to ingest
         """
-        runner = CliRunner()
-        fixture_content = EDGE_CASES.read_text()
-
-        nodes = (Node(id="cafe", label="Coffee", type="Activity", source="user-stated"),)
-        graph = Graph(nodes=nodes, edges=())
-
-        mock_engine = MagicMock()
-        mock_engine.ingest = AsyncMock(return_value=graph)
-        mock_engine.persist = MagicMock()
+        call_args = _paste_and_capture(
+            runner, maya_edge_cases_text, make_mock_engine(_SIMPLE_ACTIVITY_GRAPH, ingest=True)
+        )
 
-        with patch("sentinel.core.engine.CogneeEngine", return_value=mock_engine):
-            result = runner.invoke(main, ["paste"], input=fixture_content, catch_exceptions=False)
-
-            assert result.exit_code == EXIT_SUCCESS
-            mock_engine.ingest.assert_called_once()
-            call_args = mock_engine.ingest.call_args[0][0]
-            # Verify Unicode was preserved (should have non-ASCII chars)
-            has_unicode = any(ord(c) > 127 for c in call_args)
-            assert has_unicode, (
-                f"Unicode characters should be preserved. Got: {repr(call_args[:100])}..."
-            )
+        # Verify Unicode was preserved (should have non-ASCII chars)
+        assert not call_args.isascii(), (
+            f"Unicode characters should be preserved. Got: {repr(call_args[:100])}..."
+        )
 
 
 class TestDemoStability:
     """[P1] Demo stability - consecutive runs succeed."""
 
-    @pytest.mark.parametrize("run_number", range(5))
-    def test_consecutive_check_runs_stable(self, run_number: int) -> None:
+    def test_consecutive_check_runs_stable(
+        self, runner: CliRunner, make_mock_engine: MockEngineFactory
+    ) -> None:
         """Five consecutive check runs all succeed (AC7).
 
-        This parameterized test runs 5 times to verify stability.
+        Runs check five times back to back against the same patched engine.
         """
-        runner = CliRunner()
-
-        # Simple graph without collision
-        nodes = (Node(id="meeting", label="Team Meeting", type="Activity", source="user-stated"),)
-        graph = Graph(nodes=nodes, edges=())
-
-        mock_engine = MagicMock()
-        mock_engine.load = MagicMock(return_value=graph)
+        mock_engine = make_mock_engine(_SIMPLE_ACTIVITY_GRAPH)
 
         with patch("sentinel.core.engine.CogneeEngine", return_value=mock_engine):
-            result = runner.invoke(main, ["check"], catch_exceptions=False)
+            for run_number in range(5):
+                result = runner.invoke(main, ["check"], catch_exceptions=False)
 
-            assert result.exit_code == EXIT_SUCCESS, (
-                f"Run {run_number + 1}/5 failed. Exit code: {result.exit_code}. "
-                f"Output: {result.output}"
-            )
+                assert result.exit_code == EXIT_SUCCESS, (
+                    f"Run {run_number + 1}/5 failed. Exit code: {result.exit_code}. "
+                    f"Output: {result.output}"
+                )
 
 
 class TestCIReadiness:
@@ -323,12 +321,16 @@ class TestCIReadiness:
         # This prevents "unknown marker" warnings when running pytest
         pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
         assert pyproject_path.exists(), "pyproject.toml not found"
-        content = pyproject_path.read_text()
-        assert "live" in content and "markers" in content, (
-            "pytest 'live' marker should be configured in pyproject.toml"
+        with pyproject_path.open("rb") as f:
+            markers = tomllib.load(f)["tool"]["pytest"]["ini_options"].get("markers", [])
+        marker_names = {marker.split(":", 1)[0].strip() for marker in markers}
+        assert "live" in marker_names, (
+            f"pytest 'live' marker should be configured in pyproject.toml. Got: {markers}"
         )
 
-    def test_tests_run_without_api_key(self) -> None:
+    def test_tests_run_without_api_key(
+        self, runner: CliRunner, make_mock_engine: MockEngineFactory
+    ) -> None:
         """Tests excluding 'live' marker don't require API keys (AC9).
 
         GIVEN: CogneeEngine is mocked (as in all non-live tests)
@@ -339,12 +341,7 @@ class TestCIReadiness:
         for all non-live tests, so validate_api_key() passes. This test
         verifies the pattern works when both are mocked.
         """
-        runner = CliRunner()
-        nodes = (Node(id="test", label="Test Activity", type="Activity", source="user-stated"),)
-        graph = Graph(nodes=nodes, edges=())
-
-        mock_engine = MagicMock()
-        mock_engine.load = MagicMock(return_value=graph)
+        mock_engine = make_mock_engine(_SIMPLE_ACTIVITY_GRAPH)
 
         # Mock both the engine and validate_api_key to prove tests work without real keys
         with (
@@ -13,12 +13,6 @@ from click.testing import CliRunner
 from sentinel.cli.commands import main
 
 
-@pytest.fixture
-def runner() -> CliRunner:
-    """Create CLI runner for tests."""
-    return CliRunner()
-
-
 class TestMainHelpText:
     """Tests for sentinel --help output."""
 
@@ -13,12 +13,6 @@ from click.testing import CliRunner
 from sentinel.core.types import Edge, Graph, Node
 
 
-@pytest.fixture
-def runner() -> CliRunner:
-    """Provide a CliRunner for testing CLI commands."""
-    return CliRunner()
-
-
 @pytest.fixture
 def graph_with_ai_nodes(tmp_path: Path) -> Graph:
     """Create a graph with both user-stated and AI-inferred nodes."""
@@ -591,8 +591,8 @@ class TestGraphCommandHtmlErrorHandling:
                 mock_engine = mock_engine_class.return_value
                 mock_engine.load.return_value = sample_graph
 
-                # Mock Path.write_text to raise PermissionError
-                with patch("pathlib.Path.write_text") as mock_write:
+                # Mock the HTML file writer to raise PermissionError
+                with patch("sentinel.cli.commands.render_html_to_file") as mock_write:
                     mock_write.side_effect = PermissionError("Permission denied")
                     result = runner.invoke(main, ["graph", "--format", "html"])
 
@@ -610,8 +610,8 @@ class TestGraphCommandHtmlErrorHandling:
                 mock_engine = mock_engine_class.return_value
                 mock_engine.load.return_value = sample_graph
 
-                # Mock Path.write_text to raise OSError
-                with patch("pathlib.Path.write_text") as mock_write:
+                # Mock the HTML file writer to raise OSError
+                with patch("sentinel.cli.commands.render_html_to_file") as mock_write:
                     mock_write.side_effect = OSError("Disk full")
                     result = runner.invoke(main, ["graph", "--format", "html"])
 
@@ -200,6 +200,17 @@ class TestLoadConfig:
 
         assert result == DEFAULT_CONFIG, f"Expected default config, got {result}"
 
+    def test_returns_default_singleton_when_no_settings(self, tmp_path: Path) -> None:
+        """Returns DEFAULT_CONFIG itself for a file with only comments or unknown keys."""
+        from sentinel.core.config import DEFAULT_CONFIG, load_config
+
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('# just a comment\nunknown_key = "ignored"\n')
+
+        result = load_config(config_file)
+
+        assert result is DEFAULT_CONFIG, f"Expected the DEFAULT_CONFIG instance, got {result}"
+
     def test_loads_valid_toml_config(self, tmp_path: Path) -> None:
         """Loads and parses valid TOML configuration."""
         from sentinel.core.config import load_config
@@ -348,6 +359,21 @@ class TestWriteDefaultConfig:
         mode = config_path.stat().st_mode & 0o777
         assert mode == 0o600, f"Expected 0o600, got {oct(mode)}"
 
+    def test_stale_temp_file_does_not_widen_permissions(self, tmp_path: Path) -> None:
+        """A leftover world-readable .tmp file still yields a 600 config file."""
+        from sentinel.core.config import write_default_config
+
+        config_path = tmp_path / "config.toml"
+        stale_temp = config_path.with_suffix(".tmp")
+        stale_temp.write_text("stale")
+        stale_temp.chmod(0o644)
+
+        write_default_config(config_path)
+
+        mode = config_path.stat().st_mode & 0o777
+        assert mode == 0o600, f"Expected 0o600, got {oct(mode)}"
+        assert not stale_temp.exists(), "Temp file should be renamed into place"
+
     def test_creates_config_directory_if_not_exists(self, tmp_path: Path) -> None:
         """Creates config directory if it doesn't exist."""
         from sentinel.core.config import get_xdg_config_home, write_default_config
@@ -1,5 +1,10 @@
 """Tests for core types module."""
 
+import dataclasses
+import pickle
+
+import pytest
+
 
 def test_node_dataclass_has_required_fields() -> None:
     """Node should have id, label, type, source, and metadata fields."""
@@ -50,6 +55,20 @@ def test_edge_dataclass_has_required_fields() -> None:
     assert edge.metadata == {"reason": "emotionally draining"}
 
 
+def test_node_and_edge_use_slots() -> None:
+    """Node and Edge should be slotted (no per-instance __dict__) and stay frozen."""
+    from sentinel.core.types import Edge, Node
+
+    node = Node(id="1", label="Test", type="Person", source="user-stated")
+    edge = Edge(source_id="1", target_id="2", relationship="DRAINS", confidence=0.8)
+
+    assert not hasattr(node, "__dict__"), "Expected Node to use __slots__"
+    assert not hasattr(edge, "__dict__"), "Expected Edge to use __slots__"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        node.label = "Changed"  # type: ignore[misc]
+    assert dataclasses.replace(edge, confidence=0.5).confidence == 0.5
+
+
 def test_graph_dataclass_has_nodes_and_edges() -> None:
     """Graph should have nodes and edges lists."""
     from sentinel.core.types import Edge, Graph, Node
@@ -76,6 +95,35 @@ def test_graph_empty_by_default() -> None:
     assert graph.edges == (), f"Expected empty edges tuple, got {graph.edges}"
 
 
+def test_graph_by_id_indexes_nodes_and_is_cached() -> None:
+    """Graph.by_id should map node IDs to nodes and be built once per instance."""
+    from sentinel.core.types import Graph, Node
+
+    node1 = Node(id="1", label="Person A", type="Person", source="user-stated", metadata={})
+    node2 = Node(id="2", label="Activity B", type="Activity", source="ai-inferred", metadata={})
+    graph = Graph(nodes=(node1, node2), edges=())
+
+    assert graph.by_id == {"1": node1, "2": node2}
+    assert graph.by_id is graph.by_id, "Expected by_id to be cached on the instance"
+    assert graph == Graph(nodes=(node1, node2), edges=()), "Cache must not affect equality"
+
+
+def test_graph_pickle_round_trip_preserves_graph() -> None:
+    """Graph should survive pickling, e.g. when shared with pytest-xdist workers."""
+    from sentinel.core.types import Edge, Graph, Node
+
+    node1 = Node(id="1", label="Person A", type="Person", source="user-stated", metadata={})
+    node2 = Node(id="2", label="Activity B", type="Activity", source="ai-inferred", metadata={})
+    edge = Edge(source_id="1", target_id="2", relationship="DRAINS", confidence=0.8)
+    graph = Graph(nodes=(node1, node2), edges=(edge,))
+    _ = graph.by_id  # Pickle with the cached index already populated
+
+    restored = pickle.loads(pickle.dumps(graph))
+
+    assert restored == graph, f"Expected round-tripped graph to equal original, got {restored}"
+    assert restored.by_id == {"1": node1, "2": node2}, "Expected by_id to survive pickling"
+
+
 def test_scored_collision_dataclass_has_required_fields() -> None:
     """ScoredCollision should have path, confidence, and source_breakdown fields."""
     from sentinel.core.types import ScoredCollision
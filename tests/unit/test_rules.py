@@ -5,7 +5,13 @@ Tests for graph traversal, pattern matching, and collision scoring.
 
 import pytest
 
-from sentinel.core.types import Edge, Graph, Node
+from sentinel.core.rules import (
+    detect_cross_domain_collisions,
+    find_collision_paths,
+    score_collision,
+    score_collision_with_domains,
+)
+from sentinel.core.types import Edge, Graph, Node, ScoredCollision
 
 
 class TestGetNodeEdges:
@@ -198,8 +204,6 @@ class TestFindCollisionPaths:
 
     def test_find_collision_paths_finds_valid_pattern(self) -> None:
         """find_collision_paths should find DRAINS → CONFLICTS_WITH → REQUIRES pattern."""
-        from sentinel.core.rules import find_collision_paths
-
         nodes = (
             Node(id="person-aunt-susan", label="Aunt Susan", type="Person", source="user-stated"),
             Node(
@@ -243,8 +247,6 @@ class TestFindCollisionPaths:
 
     def test_find_collision_paths_returns_empty_for_no_drains(self) -> None:
         """find_collision_paths should return empty list if no DRAINS edges."""
-        from sentinel.core.rules import find_collision_paths
-
         nodes = (
             Node(id="a", label="A", type="Activity", source="user-stated"),
             Node(id="b", label="B", type="Activity", source="user-stated"),
@@ -258,8 +260,6 @@ class TestFindCollisionPaths:
 
     def test_find_collision_paths_handles_empty_graph(self) -> None:
         """find_collision_paths should return empty list for empty graph."""
-        from sentinel.core.rules import find_collision_paths
-
         graph = Graph(nodes=(), edges=())
 
         paths = find_collision_paths(graph)
@@ -268,8 +268,6 @@ class TestFindCollisionPaths:
 
     def test_find_collision_paths_prevents_cycles(self) -> None:
         """find_collision_paths should not get stuck in cycles."""
-        from sentinel.core.rules import find_collision_paths
-
         # Create a graph with a cycle
         nodes = (
             Node(id="a", label="A", type="Person", source="user-stated"),
@@ -416,7 +414,7 @@ class TestScoreCollision:
 
     def test_score_collision_calculates_average_confidence(self) -> None:
         """score_collision should calculate confidence from edge confidences."""
-        from sentinel.core.rules import CollisionPath, score_collision
+        from sentinel.core.rules import CollisionPath
 
         nodes = (
             Node(id="a", label="A", type="Person", source="user-stated"),
@@ -441,7 +439,7 @@ class TestScoreCollision:
 
     def test_score_collision_tracks_source_breakdown(self) -> None:
         """score_collision should track ai_inferred vs user_stated counts."""
-        from sentinel.core.rules import CollisionPath, score_collision
+        from sentinel.core.rules import CollisionPath
 
         nodes = (
             Node(id="a", label="A", type="Person", source="user-stated"),
@@ -464,7 +462,7 @@ class TestScoreCollision:
 
     def test_score_collision_returns_immutable_path(self) -> None:
         """score_collision should return tuple (immutable) for path."""
-        from sentinel.core.rules import CollisionPath, score_collision
+        from sentinel.core.rules import CollisionPath
 
         nodes = (
             Node(id="a", label="A", type="Person", source="user-stated"),
@@ -711,7 +709,6 @@ class TestDetectCrossDomainCollisions:
 
     def test_detect_cross_domain_collisions_finds_social_to_professional(self) -> None:
         """Should detect collision crossing from SOCIAL to PROFESSIONAL domain."""
-        from sentinel.core.rules import detect_cross_domain_collisions
         from sentinel.core.types import Edge, Graph, Node
 
         nodes = (
@@ -769,10 +766,12 @@ class TestDetectCrossDomainCollisions:
         assert any("[SOCIAL]" in str(c.path) for c in collisions), (
             "Should have SOCIAL domain label in path"
         )
+        assert any("[PROFESSIONAL]" in str(c.path) for c in collisions), (
+            "Should have PROFESSIONAL domain label in path"
+        )
 
     def test_detect_cross_domain_collisions_empty_graph_returns_empty(self) -> None:
-        """Should return empty list for empty graph."""
-        from sentinel.core.rules import detect_cross_domain_collisions
+        """Should return empty list (not None) for empty graph (AC #5)."""
         from sentinel.core.types import Graph
 
         graph = Graph(nodes=(), edges=())
@@ -782,8 +781,7 @@ class TestDetectCrossDomainCollisions:
         assert collisions == [], f"Expected empty list, got {collisions}"
 
     def test_detect_cross_domain_collisions_no_drains_returns_empty(self) -> None:
-        """Should return empty list when no DRAINS edges exist."""
-        from sentinel.core.rules import detect_cross_domain_collisions
+        """Should return empty list when no DRAINS edges exist (AC #6: no false positives)."""
         from sentinel.core.types import Edge, Graph, Node
 
         nodes = (
@@ -856,7 +854,7 @@ class TestScoreCollisionWithDomains:
 
     def test_score_collision_with_domains_adds_domain_labels(self) -> None:
         """Should add domain labels to path for display."""
-        from sentinel.core.rules import CollisionPath, score_collision_with_domains
+        from sentinel.core.rules import CollisionPath
         from sentinel.core.types import Edge, Graph, Node
 
         nodes = (
@@ -902,11 +900,7 @@ class TestScoreCollisionWithDomains:
 
     def test_score_collision_with_domains_boosts_cross_domain_confidence(self) -> None:
         """Should boost confidence for cross-domain collisions."""
-        from sentinel.core.rules import (
-            CollisionPath,
-            score_collision,
-            score_collision_with_domains,
-        )
+        from sentinel.core.rules import CollisionPath
         from sentinel.core.types import Edge, Graph, Node
 
         nodes = (
@@ -940,6 +934,7 @@ class TestScoreCollisionWithDomains:
 
         base_result = score_collision(path, graph)
         enhanced_result = score_collision_with_domains(path, graph)
+        assert 0.0 <= base_result.confidence <= 1.0, "Base confidence should be valid"
 
         # Cross-domain should have higher confidence (10% boost)
         assert enhanced_result.confidence > base_result.confidence, (
@@ -948,7 +943,7 @@ class TestScoreCollisionWithDomains:
 
     def test_score_collision_with_domains_preserves_source_breakdown(self) -> None:
         """Should preserve source breakdown from base scoring."""
-        from sentinel.core.rules import CollisionPath, score_collision_with_domains
+        from sentinel.core.rules import CollisionPath
         from sentinel.core.types import Edge, Graph, Node
 
         nodes = (
@@ -1091,7 +1086,6 @@ class TestDeduplicateCollisions:
     def test_deduplicate_collisions_removes_duplicates(self) -> None:
         """Should remove duplicate collision paths."""
         from sentinel.core.rules import deduplicate_collisions
-        from sentinel.core.types import ScoredCollision
 
         collisions = [
             ScoredCollision(path=("A", "DRAINS", "B"), confidence=0.8, source_breakdown={}),
@@ -1106,7 +1100,6 @@ class TestDeduplicateCollisions:
     def test_deduplicate_collisions_preserves_higher_confidence(self) -> None:
         """Should keep collision with higher confidence when deduplicating."""
         from sentinel.core.rules import deduplicate_collisions
-        from sentinel.core.types import ScoredCollision
 
         collisions = [
             ScoredCollision(path=("A", "DRAINS", "B"), confidence=0.6, source_breakdown={}),
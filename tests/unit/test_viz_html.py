@@ -4,6 +4,12 @@ Tests render_html() function which generates self-contained HTML
 with SVG-based graph visualization.
 """
 
+import os
+import stat
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
 from sentinel.core.types import Edge, Graph, Node
@@ -376,3 +382,120 @@ class TestRenderHtmlMetadata:
         # Should explain user-stated vs AI-inferred distinction
         assert "User-stated" in html, "Legend should explain User-stated nodes"
         assert "AI-inferred" in html, "Legend should explain AI-inferred nodes"
+
+
+class TestRenderHtmlToFile:
+    """Test streaming HTML output directly to a file."""
+
+    def test_render_html_to_file_matches_render_html(
+        self, mock_graph: Graph, tmp_path: Path
+    ) -> None:
+        """File output is identical to the in-memory render."""
+        from sentinel.viz.html import render_html, render_html_to_file
+
+        collision_paths = [("Aunt Susan", "DRAINS", "drained")]
+        output_path = tmp_path / "graph.html"
+
+        render_html_to_file(mock_graph, output_path, collision_paths=collision_paths, title="T")
+
+        expected = render_html(mock_graph, collision_paths=collision_paths, title="T")
+        # Footer timestamps may differ by a second between the two renders
+        assert (
+            output_path.read_text(encoding="utf-8").split("<footer>")[0]
+            == (expected.split("<footer>")[0])
+        )
+
+    def test_render_html_to_file_handles_empty_graph(
+        self, empty_graph: Graph, tmp_path: Path
+    ) -> None:
+        """Empty graph writes the empty-state document."""
+        from sentinel.viz.html import render_html_to_file
+
+        output_path = tmp_path / "empty.html"
+        render_html_to_file(empty_graph, output_path)
+
+        content = output_path.read_text(encoding="utf-8")
+        assert "No data available" in content
+        assert content.endswith("</html>")
+
+    def test_render_html_to_file_keeps_existing_file_on_render_error(
+        self, mock_graph: Graph, tmp_path: Path
+    ) -> None:
+        """A failed render leaves the previous file intact and no temp file behind."""
+        from sentinel.viz.html import render_html_to_file
+
+        output_path = tmp_path / "graph.html"
+        output_path.write_text("previous report", encoding="utf-8")
+
+        with patch("sentinel.viz.html._render_into", side_effect=ValueError("boom")):
+            with pytest.raises(ValueError):
+                render_html_to_file(mock_graph, output_path)
+
+        assert output_path.read_text(encoding="utf-8") == "previous report", (
+            "Existing file should survive a failed render"
+        )
+        assert list(tmp_path.iterdir()) == [output_path], (
+            f"Expected no leftover temp file, found {list(tmp_path.iterdir())}"
+        )
+
+    def test_render_html_to_file_leaves_existing_tmp_file_alone(
+        self, mock_graph: Graph, tmp_path: Path
+    ) -> None:
+        """A user's own graph.html.tmp is neither overwritten nor deleted."""
+        from sentinel.viz.html import render_html_to_file
+
+        output_path = tmp_path / "graph.html"
+        user_tmp = tmp_path / "graph.html.tmp"
+        user_tmp.write_text("user data", encoding="utf-8")
+
+        render_html_to_file(mock_graph, output_path)
+
+        assert user_tmp.read_text(encoding="utf-8") == "user data", (
+            "Pre-existing .tmp file should be untouched"
+        )
+        assert sorted(tmp_path.iterdir()) == [output_path, user_tmp], (
+            f"Expected only the output and the user's file, found {list(tmp_path.iterdir())}"
+        )
+        assert output_path.read_text(encoding="utf-8").endswith("</html>")
+
+    def test_render_html_to_file_updates_symlink_target_and_keeps_mode(
+        self, mock_graph: Graph, tmp_path: Path
+    ) -> None:
+        """A symlinked path stays a link; its target is rewritten with its old mode."""
+        from sentinel.viz.html import render_html_to_file
+
+        target = tmp_path / "report.html"
+        target.write_text("previous report", encoding="utf-8")
+        target.chmod(0o640)
+        link = tmp_path / "latest.html"
+        link.symlink_to(target)
+
+        render_html_to_file(mock_graph, link)
+
+        assert link.is_symlink(), "Symlink should not be replaced by a regular file"
+        assert target.read_text(encoding="utf-8").endswith("</html>")
+        mode = stat.S_IMODE(target.stat().st_mode)
+        assert mode == 0o640, f"Expected mode 0o640 to be kept, got {oct(mode)}"
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs need POSIX")
+    def test_render_html_to_file_writes_directly_to_fifo(
+        self, mock_graph: Graph, tmp_path: Path
+    ) -> None:
+        """Non-regular targets are written in place rather than replaced."""
+        from sentinel.viz.html import render_html_to_file
+
+        fifo_path = tmp_path / "out.fifo"
+        os.mkfifo(fifo_path)
+        received: list[str] = []
+        reader = threading.Thread(
+            target=lambda: received.append(fifo_path.read_text(encoding="utf-8"))
+        )
+        reader.start()
+
+        render_html_to_file(mock_graph, fifo_path)
+        reader.join(timeout=10)
+
+        assert stat.S_ISFIFO(fifo_path.stat().st_mode), "FIFO should not be replaced"
+        assert received and received[0].endswith("</html>"), (
+            "Expected the full document to be streamed through the FIFO"
+        )